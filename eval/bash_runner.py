@@ -1,57 +1,165 @@
-"""Bash runner for the bash adventure. Tracks cwd and runs each command as a subprocess."""
+"""Bash runner for the bash adventure. Tracks cwd and runs commands in one long-lived bash process."""
 
-import subprocess
 import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+import uuid
+
+# Reads NUL-terminated (cwd, command) pairs and runs each in a fresh subshell,
+# so state (cwd, variables, `exit`) stays per-command as with `bash -c`, then
+# prints the sentinel ($1). eval of a value read from stdin means unbalanced
+# quotes can't swallow the protocol, and keeping the whole loop on line 1
+# keeps error messages as "bash: line 1: ...". stderr is merged into stdout
+# at the pipe (see _spawn).
+_SHELL_LOOP = "; ".join([
+    "__s=$1",
+    "set --",
+    "while IFS= read -r -d '' __cwd && IFS= read -r -d '' __cmd",
+    "do ( unset __s; cd \"$__cwd\" && eval \"$__cmd\" ) < /dev/null",
+    "printf '\\n%s\\n' \"$__s\"",
+    "done",
+])
+
+
+# Substrings of commands that may change what a cd resolves to
+_FS_MUTATORS = ("rm", "mv", "mkdir", "ln", "cp", "tar")
+
+
+def _drain(stream, q: queue.Queue):
+    """Copy lines from a pipe into a queue; None marks EOF."""
+    for line in iter(stream.readline, ""):
+        q.put(line)
+    q.put(None)
 
 
 class BashRunner:
     def __init__(self, station_dir: str):
         self.station_dir = os.path.abspath(station_dir)
         self.cwd = os.path.join(self.station_dir, "airlock")
+        with open(os.path.join(self.station_dir, "START")) as f:
+            self._start_text = f.read()
+        self._win_path = os.path.join(self.station_dir, ".win")
+        # Only commands run in the shell can create .win; cd is handled here
+        self._won = False
+        self._win_stale = True
+        # Resolved cd targets: normalized path -> real directory, or None if not a directory
+        self._real_cache: dict[str, str | None] = {}
+        # Marks the end of each command's output; unguessable so output can't fake it
+        self._sentinel = f"__END_{uuid.uuid4().hex}__"
+        self._spawn()
+
+    def _spawn(self):
+        """Start the shell, plus a thread that drains its output so the pipe never fills up."""
+        self.proc = subprocess.Popen(
+            ["bash", "--noprofile", "--norc", "-c", _SHELL_LOOP, "bash", self._sentinel],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self.station_dir,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            start_new_session=True,
+        )
+        self._output: queue.Queue = queue.Queue()
+        threading.Thread(target=_drain, args=(self.proc.stdout, self._output), daemon=True).start()
+
+    def _kill(self):
+        # The shell leads its own session, so this also takes out anything it started
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.proc.wait()
+
+    def _read_until_sentinel(self, deadline: float) -> str:
+        lines = []
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                line = self._output.get(timeout=remaining)
+            except queue.Empty:
+                raise subprocess.TimeoutExpired("bash", 0)
+            if line is None:
+                raise RuntimeError("bash exited unexpectedly")
+            if line.rstrip("\n") == self._sentinel:
+                break
+            lines.append(line)
+        # Drop the newline printed ahead of the sentinel
+        return "".join(lines)[:-1]
 
     def start(self) -> str:
         """Return the START text."""
-        start_file = os.path.join(self.station_dir, "START")
-        with open(start_file) as f:
-            return f.read()
+        return self._start_text
 
     def run_command(self, command: str, timeout: float = 10.0) -> str:
         """Run a command in the current working directory, track cd changes."""
         command = command.strip()
         if not command:
             return ""
+        # NUL delimits the fields sent to the shell, and no command could carry one anyway
+        if "\0" in command:
+            return "ERROR: embedded null byte"
 
         # Handle cd specially — we need to track the directory change
         if command.startswith("cd "):
             target = command[3:].strip()
             # Resolve the path relative to current cwd
             new_path = os.path.normpath(os.path.join(self.cwd, target))
-            # Follow symlinks to get the real path
-            real_path = os.path.realpath(new_path)
-            if os.path.isdir(real_path):
+            if new_path in self._real_cache:
+                real_path = self._real_cache[new_path]
+            else:
+                # Follow symlinks to get the real path
+                real_path = os.path.realpath(new_path)
+                if not os.path.isdir(real_path):
+                    real_path = None
+                self._real_cache[new_path] = real_path
+            if real_path is not None:
                 self.cwd = real_path
                 return ""
             else:
                 return f"bash: cd: {target}: No such file or directory"
 
-        # For everything else, run in a subshell
+        # Anything that might add, remove or relink directories invalidates cd results
+        if any(word in command for word in _FS_MUTATORS):
+            self._real_cache.clear()
+
+        # For everything else, hand it to the persistent shell
+        self._win_stale = True
+        deadline = time.monotonic() + timeout
         try:
-            result = subprocess.run(
-                ["bash", "-c", command],
-                cwd=self.cwd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            output = result.stdout
-            if result.stderr:
-                output += result.stderr
-            return output.strip()
+            self.proc.stdin.write(f"{self.cwd}\0{command}\0")
+            self.proc.stdin.flush()
+            return self._read_until_sentinel(deadline).strip()
         except subprocess.TimeoutExpired:
+            self._kill()
+            self._spawn()
             return "ERROR: Command timed out."
         except Exception as e:
+            self._kill()
+            self._spawn()
             return f"ERROR: {e}"
 
     def check_win(self) -> bool:
         """Check if .win file exists."""
-        return os.path.exists(os.path.join(self.station_dir, ".win"))
+        if self._win_stale:
+            try:
+                os.stat(self._win_path)
+                self._won = True
+            except FileNotFoundError:
+                self._won = False
+            self._win_stale = False
+        return self._won
+
+    def close(self):
+        """Shut down the persistent shell. EOF on stdin ends its read loop."""
+        self.proc.stdin.close()
+        try:
+            self.proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self._kill()
@@ -2,21 +2,41 @@
 """Eval harness: runs an LLM against the bash + MCP adventure and records results."""
 
 import argparse
+import asyncio
+import fcntl
 import json
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 import yaml
 from dotenv import load_dotenv
 import litellm
 
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+import llm_cache
 from bash_runner import BashRunner
 from mcp_runner import McpRunner, TOOL_SCHEMAS
 
 # Load .env from project root
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
+# Set LLM_CACHE=1 to replay identical temperature-0 requests from disk
+_llm_cache = llm_cache.LlmCache() if llm_cache.enabled() else None
+
 BASH_SYSTEM_PROMPT = """\
 You are playing a text adventure game on a damaged space station.
 Your goal: activate the bridge console to send a distress signal.
@@ -49,6 +69,12 @@ cd north; ls
 If you are stuck, respond with: GIVE_UP
 """
 
+# The bash prompt without the GOOD/BAD examples, for ablating them (--short-prompt)
+BASH_SYSTEM_PROMPT_SHORT = (
+    BASH_SYSTEM_PROMPT[:BASH_SYSTEM_PROMPT.index("GOOD examples:")]
+    + "If you are stuck, respond with: GIVE_UP\n"
+)
+
 MCP_SYSTEM_PROMPT = """\
 You are playing a text adventure game on a damaged space station.
 Your goal: activate the bridge console to send a distress signal.
@@ -65,137 +91,278 @@ Use the tools to explore the station, find items, and solve puzzles.
 If you are stuck, respond with: GIVE_UP
 """
 
+# Command from a bash-mode reply: the first line, minus surrounding backticks
+# and whitespace, cut at any chat-template token like <|im_end|> or <|eot_id|>
+_CMD_RE = re.compile(r"`*[^\S\n]*((?:[^\n<]|<(?!\|))*?)[^\S\n]*(?:<\||`*[^\S\n]*(?:\n|$))")
+
+# Longest command/tool output sent back to the model. A single `cat` of a big
+# file would otherwise be re-sent on every later turn.
+MAX_OBS = 2000
+
+
+def _truncate_obs(text: str) -> str:
+    if len(text) <= MAX_OBS:
+        return text
+    return text[:MAX_OBS] + f"\n…[truncated {len(text) - MAX_OBS} chars]"
+
+
+# Turns of history sent to the model. The full transcript is still kept
+# (and saved to JSON); only the request is windowed.
+CONTEXT_TURNS = 20
+
+
+def _system_message(model: str, prompt: str) -> dict:
+    """Build the static system message, marked cacheable for Anthropic models.
+
+    OpenAI-style providers cache long identical prefixes automatically;
+    Anthropic only caches up to an explicit cache_control breakpoint.
+    """
+    if "anthropic" in model or "claude" in model:
+        return {
+            "role": "system",
+            "content": [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}],
+        }
+    return {"role": "system", "content": prompt}
+
+
+def _context_window(messages: list[dict], max_turns: int = CONTEXT_TURNS) -> list[dict]:
+    """Return the messages to send: the fixed prefix plus recent turns.
+
+    messages[0:2] (system prompt + game start) never change, so provider
+    prefix caches can reuse them on every call. Each turn starts with an
+    assistant message; older turns are dropped in blocks of max_turns // 2
+    so the start of the window also stays put for several calls rather
+    than sliding (and missing the cache) every turn.
+    """
+    starts = [i for i in range(2, len(messages)) if messages[i]["role"] == "assistant"]
+    if len(starts) <= max_turns:
+        return messages
+    step = max(max_turns // 2, 1)
+    drop = (len(starts) - step) // step * step
+    return messages[:2] + messages[starts[drop]:]
+
+
+def _first_line(text: str) -> str:
+    """text up to the first newline that follows non-blank text."""
+    start = len(text) - len(text.lstrip())
+    end = text.find("\n", start)
+    return text if end == -1 else text[:end]
+
+
+async def _acompletion_first_line(**kwargs):
+    """Stream a completion, stopping once its first non-blank line is complete.
+
+    Bash mode only ever runs the first line of a reply, so anything after it
+    is wasted latency and tokens. Returns a regular (non-streamed) response
+    whose content is cut to that first line. A stream cut short never gets
+    its usage chunk, so litellm estimates the tokens for it and the response
+    is marked with usage_estimated.
+    """
+    stream = await litellm.acompletion(**kwargs, stream=True, stream_options={"include_usage": True})
+    chunks = []
+    content = ""
+    usage = None
+    async for chunk in stream:
+        chunks.append(chunk)
+        if getattr(chunk, "usage", None):
+            usage = chunk.usage
+        if chunk.choices:
+            content += chunk.choices[0].delta.content or ""
+            if "\n" in content.lstrip():
+                break
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+    if not chunks:
+        raise RuntimeError("empty response stream")
+    response = litellm.stream_chunk_builder(chunks, messages=kwargs["messages"])
+    if response is None:
+        raise RuntimeError("could not assemble streamed response")
+    message = response.choices[0].message
+    message.content = _first_line(message.content or "")
+    if usage is not None:
+        response.usage = usage
+    response.usage_estimated = usage is None
+    return response
+
 
 class Logger:
-    """Tees output to both stdout and a log file, flushing after every write."""
+    """Tees output to both stdout and a log file.
+
+    File writes are batched and flushed at turn boundaries (or every
+    FLUSH_LINES lines) rather than after every line.
+    """
 
-    def __init__(self, log_dir: str, label: str, mode: str):
+    FLUSH_LINES = 32
+
+    def __init__(self, log_dir: str, label: str, mode: str, quiet: bool = False):
         os.makedirs(log_dir, exist_ok=True)
         safe = label.replace(" ", "_").replace("/", "_")
         self.path = os.path.join(log_dir, f"{safe}_{mode}.log")
-        self.f = open(self.path, "w")
+        self.f = open(self.path, "w", buffering=1 << 16)
+        self.quiet = quiet
+        self._buf: list[str] = []
 
     def log(self, msg: str = ""):
-        print(msg)
-        self.f.write(msg + "\n")
+        if not self.quiet:
+            print(msg)
+        self._buf.append(msg)
+        if len(self._buf) >= self.FLUSH_LINES:
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            self.f.write("\n".join(self._buf) + "\n")
+            self._buf.clear()
         self.f.flush()
 
     def close(self):
+        self.flush()
         self.f.close()
 
 
-def run_bash_eval(model: str, station_dir: str, token_limit: int, log: Logger) -> dict:
+async def run_bash_eval(model: str, station_dir: str, token_limit: int, log: Logger,
+                        short_prompt: bool = False) -> dict:
     runner = BashRunner(station_dir)
     start_text = runner.start()
+    loop = asyncio.get_running_loop()
 
     messages = [
-        {"role": "system", "content": BASH_SYSTEM_PROMPT},
+        _system_message(model, BASH_SYSTEM_PROMPT_SHORT if short_prompt else BASH_SYSTEM_PROMPT),
         {"role": "user", "content": f"Game started. You are in the airlock.\n\n{start_text}"},
     ]
 
     total_prompt_tokens = 0
     total_completion_tokens = 0
+    cached_tokens = 0
+    cached_turns = 0
+    # Turns whose stream was cut before the usage chunk, so litellm estimated their tokens
+    estimated_usage_turns = 0
     turns = 0
     commands = []
     won = False
     gave_up = False
+    # Streaks are tracked incrementally rather than by rescanning `commands`
+    last_command = None
+    repeat_streak = 0
+    empty_streak = 0
 
     log.log(f"=== Eval: {model} [bash] ===")
     log.log(f"Token limit: {token_limit}")
+    if short_prompt:
+        log.log("Prompt: short (no examples)")
     log.log()
 
-    while True:
-        total_tokens = total_prompt_tokens + total_completion_tokens
-        if total_tokens >= token_limit:
-            log.log(f"[TOKEN LIMIT HIT: {total_tokens}]")
-            break
-
-        try:
-            response = litellm.completion(
-                model=model,
-                messages=messages,
-                temperature=0,
-                max_tokens=50,
-            )
-        except Exception as e:
-            log.log(f"[API ERROR: {e}]")
-            break
-
-        choice = response.choices[0]
-        reply = choice.message.content.strip()
-        usage = response.usage
-        total_prompt_tokens += usage.prompt_tokens
-        total_completion_tokens += usage.completion_tokens
-        turns += 1
-
-        turn_tokens = usage.prompt_tokens + usage.completion_tokens
-        log.log(f"[Turn {turns}] +{turn_tokens} tokens (total: {total_prompt_tokens + total_completion_tokens})")
-        log.log(f"  LLM: {reply}")
+    try:
+        while True:
+            log.flush()
+            total_tokens = total_prompt_tokens + total_completion_tokens
+            if total_tokens >= token_limit:
+                log.log(f"[TOKEN LIMIT HIT: {total_tokens}]")
+                break
 
-        if "GIVE_UP" in reply.upper():
-            gave_up = True
-            log.log("  [MODEL GAVE UP]")
-            break
+            try:
+                response, cached = await llm_cache.acompletion(
+                    _llm_cache,
+                    complete=_acompletion_first_line,
+                    model=model,
+                    messages=_context_window(messages),
+                    temperature=0,
+                    max_tokens=50,
+                )
+            except Exception as e:
+                log.log(f"[API ERROR: {e}]")
+                break
 
-        # Extract command — first line, strip backticks and markdown
-        command = reply.strip().split("\n")[0]
-        command = command.strip("`").strip()
-        if "<|" in command:
-            command = command[:command.index("<|")].strip()
+            msg = response.choices[0].message
+            reply = msg.content.strip()
+            usage = response.usage
+            pt = usage.prompt_tokens
+            ct = usage.completion_tokens
+            total_prompt_tokens += pt
+            total_completion_tokens += ct
+            turns += 1
+
+            turn_tokens = pt + ct
+            if cached:
+                cached_turns += 1
+                cached_tokens += turn_tokens
+            estimated = getattr(response, "usage_estimated", False)
+            if estimated:
+                estimated_usage_turns += 1
+            log.log(f"[Turn {turns}] +{turn_tokens} tokens (total: {total_prompt_tokens + total_completion_tokens})"
+                    + (" [estimated]" if estimated else "") + (" [cached]" if cached else ""))
+            log.log(f"  LLM: {reply}")
+
+            if "GIVE_UP" in reply.upper():
+                gave_up = True
+                log.log("  [MODEL GAVE UP]")
+                break
 
-        commands.append(command)
-        messages.append({"role": "assistant", "content": reply})
+            # Extract command — first line, strip backticks and markdown
+            m = _CMD_RE.match(reply)
+            command = m.group(1) if m else ""
+
+            commands.append(command)
+            messages.append({"role": "assistant", "content": reply})
+            repeat_streak = repeat_streak + 1 if command == last_command else 1
+            last_command = command
+
+            # Reject empty / garbage commands
+            if not command:
+                empty_streak += 1
+                log.log(f"  [EMPTY COMMAND x{empty_streak}]")
+                if empty_streak >= 5:
+                    log.log("  [FORCE STOP: 5 consecutive empty commands]")
+                    break
+                messages.append({"role": "user", "content": "Invalid command. Send exactly one bash command, nothing else."})
+                continue
 
-        # Reject empty / garbage commands
-        if not command:
             empty_streak = 0
-            for c in reversed(commands):
-                if c == "":
-                    empty_streak += 1
-                else:
-                    break
-            log.log(f"  [EMPTY COMMAND x{empty_streak}]")
-            if empty_streak >= 5:
-                log.log("  [FORCE STOP: 5 consecutive empty commands]")
-                break
-            messages.append({"role": "user", "content": "Invalid command. Send exactly one bash command, nothing else."})
-            continue
 
-        # Loop detection
-        if len(commands) >= 3 and commands[-1] == commands[-2] == commands[-3]:
-            log.log(f"  [LOOP DETECTED: '{command}' repeated 3 times]")
-            messages.append({"role": "user", "content": f"You have run '{command}' 3 times in a row with the same result. Try a different command."})
+            # Loop detection
+            if repeat_streak >= 3:
+                log.log(f"  [LOOP DETECTED: '{command}' repeated 3 times]")
+                messages.append({"role": "user", "content": f"You have run '{command}' 3 times in a row with the same result. Try a different command."})
 
-        output = runner.run_command(command)
-        log.log(f"  OUT: {output[:200]}")
+            # run_command blocks on a subprocess; keep it off the event loop
+            output = await loop.run_in_executor(None, runner.run_command, command)
+            log.log(f"  OUT: {output[:200]}")
 
-        if runner.check_win():
-            won = True
-            messages.append({"role": "user", "content": output})
-            log.log("\n  *** WIN ***")
-            break
+            if runner.check_win():
+                won = True
+                messages.append({"role": "user", "content": _truncate_obs(output)})
+                log.log("\n  *** WIN ***")
+                break
 
-        if output:
-            messages.append({"role": "user", "content": output})
-        else:
-            messages.append({"role": "user", "content": "(no output)"})
+            if output:
+                messages.append({"role": "user", "content": _truncate_obs(output)})
+            else:
+                messages.append({"role": "user", "content": "(no output)"})
+    finally:
+        runner.close()
 
     return _finish(log, model=model, mode="bash", won=won, gave_up=gave_up,
                    prompt_tokens=total_prompt_tokens, completion_tokens=total_completion_tokens,
-                   turns=turns, commands=commands, messages=messages)
+                   cached_tokens=cached_tokens, cached_turns=cached_turns,
+                   estimated_usage_turns=estimated_usage_turns,
+                   turns=turns, commands=commands, messages=messages,
+                   prompt="short" if short_prompt else "full")
 
 
-def run_mcp_eval(model: str, token_limit: int, log: Logger) -> dict:
+async def run_mcp_eval(model: str, token_limit: int, log: Logger) -> dict:
     runner = McpRunner()
     start_text = runner.start()
 
     messages = [
-        {"role": "system", "content": MCP_SYSTEM_PROMPT},
+        _system_message(model, MCP_SYSTEM_PROMPT),
         {"role": "user", "content": f"Game started. You are in the airlock.\n\n{start_text}"},
     ]
 
     total_prompt_tokens = 0
     total_completion_tokens = 0
+    cached_tokens = 0
+    cached_turns = 0
     turns = 0
     tool_calls_log = []
     won = False
@@ -207,15 +374,17 @@ def run_mcp_eval(model: str, token_limit: int, log: Logger) -> dict:
     log.log()
 
     while True:
+        log.flush()
         total_tokens = total_prompt_tokens + total_completion_tokens
         if total_tokens >= token_limit:
             log.log(f"[TOKEN LIMIT HIT: {total_tokens}]")
             break
 
         try:
-            response = litellm.completion(
+            response, cached = await llm_cache.acompletion(
+                _llm_cache,
                 model=model,
-                messages=messages,
+                messages=_context_window(messages),
                 tools=TOOL_SCHEMAS,
                 temperature=0,
                 max_tokens=200,
@@ -224,23 +393,34 @@ def run_mcp_eval(model: str, token_limit: int, log: Logger) -> dict:
             log.log(f"[API ERROR: {e}]")
             break
 
-        choice = response.choices[0]
+        msg = response.choices[0].message
         usage = response.usage
-        total_prompt_tokens += usage.prompt_tokens
-        total_completion_tokens += usage.completion_tokens
+        pt = usage.prompt_tokens
+        ct = usage.completion_tokens
+        total_prompt_tokens += pt
+        total_completion_tokens += ct
         turns += 1
 
-        turn_tokens = usage.prompt_tokens + usage.completion_tokens
-        log.log(f"[Turn {turns}] +{turn_tokens} tokens (total: {total_prompt_tokens + total_completion_tokens})")
+        turn_tokens = pt + ct
+        if cached:
+            cached_turns += 1
+            cached_tokens += turn_tokens
+        log.log(f"[Turn {turns}] +{turn_tokens} tokens (total: {total_prompt_tokens + total_completion_tokens})"
+                + (" [cached]" if cached else ""))
 
-        if choice.message.tool_calls:
+        tool_calls = msg.tool_calls
+        content = msg.content
+        if tool_calls:
             empty_streak = 0
-            messages.append(choice.message.model_dump())
+            # exclude_none drops the null fields (function_call, audio, ...) that
+            # would otherwise be re-sent every turn
+            messages.append(msg.model_dump(exclude_none=True))
 
-            for tc in choice.message.tool_calls:
-                tool_name = tc.function.name
+            for tc in tool_calls:
+                fn = tc.function
+                tool_name = fn.name
                 try:
-                    arguments = json.loads(tc.function.arguments)
+                    arguments = _loads(fn.arguments)
                 except json.JSONDecodeError:
                     arguments = {}
 
@@ -253,7 +433,7 @@ def run_mcp_eval(model: str, token_limit: int, log: Logger) -> dict:
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tc.id,
-                    "content": result,
+                    "content": _truncate_obs(result),
                 })
 
                 if runner.check_win():
@@ -264,8 +444,8 @@ def run_mcp_eval(model: str, token_limit: int, log: Logger) -> dict:
             if won:
                 break
 
-        elif choice.message.content:
-            content = choice.message.content.strip()
+        elif content:
+            content = content.strip()
             log.log(f"  LLM: {content}")
             messages.append({"role": "assistant", "content": content})
 
@@ -288,11 +468,20 @@ def run_mcp_eval(model: str, token_limit: int, log: Logger) -> dict:
 
     return _finish(log, model=model, mode="mcp", won=won, gave_up=gave_up,
                    prompt_tokens=total_prompt_tokens, completion_tokens=total_completion_tokens,
+                   cached_tokens=cached_tokens, cached_turns=cached_turns,
                    turns=turns, commands=tool_calls_log, messages=messages)
 
 
-def _finish(log: Logger, *, model, mode, won, gave_up, prompt_tokens, completion_tokens, turns, commands, messages) -> dict:
+def _finish(log: Logger, *, model, mode, won, gave_up, prompt_tokens, completion_tokens,
+            cached_tokens, cached_turns, turns, commands, messages, prompt=None,
+            estimated_usage_turns=0) -> dict:
+    # Cached turns still count toward total_tokens so replays score the same
+    # as live runs; billed_tokens is what actually went to the API.
+    # prompt is the bash system prompt variant ("full"/"short"), None for MCP.
+    # estimated_usage_turns counts turns whose tokens litellm estimated
+    # locally because the stream was cut early; the rest are provider-reported.
     total_tokens = prompt_tokens + completion_tokens
+    billed_tokens = total_tokens - cached_tokens
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     log.log()
@@ -303,6 +492,10 @@ def _finish(log: Logger, *, model, mode, won, gave_up, prompt_tokens, completion
     log.log(f"  Gave up:     {gave_up}")
     log.log(f"  Total tokens: {total_tokens}")
     log.log(f"  Turns:       {turns}")
+    if cached_turns:
+        log.log(f"  Cached:      {cached_turns} turns ({billed_tokens} tokens billed)")
+    if estimated_usage_turns:
+        log.log(f"  Estimated:   {estimated_usage_turns} turns (tokens counted locally)")
     log.log(f"  Log:         {log.path}")
 
     result = {
@@ -313,7 +506,14 @@ def _finish(log: Logger, *, model, mode, won, gave_up, prompt_tokens, completion
         "total_tokens": total_tokens,
         "prompt_tokens": prompt_tokens,
         "completion_tokens": completion_tokens,
+        "billed_tokens": billed_tokens,
         "turns": turns,
+        "cached_turns": cached_turns,
+        "estimated_usage_turns": estimated_usage_turns,
+        "prompt": prompt,
+        # Turns of history each call saw (_context_window); runs from before
+        # windowing lack the field and saw everything
+        "context_turns": CONTEXT_TURNS,
         "commands": commands,
         "timestamp": datetime.now().isoformat(),
     }
@@ -328,6 +528,12 @@ def _finish(log: Logger, *, model, mode, won, gave_up, prompt_tokens, completion
         json.dump(json_data, f, indent=2, default=str)
     log.log(f"  JSON:        {json_path}")
 
+    # Also append the summary to runs.jsonl, which report.py reads in one pass.
+    # The lock keeps lines whole when evals in other processes finish at once.
+    with open(os.path.join(log_dir, "runs.jsonl"), "ab") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(_dumps({**result, "file": os.path.basename(json_path)}) + b"\n")
+
     return result
 
 
@@ -353,6 +559,89 @@ def _print_comparison(results: list[dict]):
         print(f"  {label:<24}   {fmt(modes.get('bash'))}   {fmt(modes.get('mcp'))}")
 
 
+class StationLock:
+    """Serializes bash evals on the shared station, across coroutines and processes.
+
+    The station is a directory tree that the game scripts mutate, so only
+    one bash eval may use it at a time. MCP evals have their own engine and
+    don't need this.
+    """
+
+    def __init__(self, station_dir: str):
+        self._lock = asyncio.Lock()
+        self._path = station_dir.rstrip(os.sep) + ".lock"
+        self._f = None
+
+    async def __aenter__(self):
+        await self._lock.acquire()
+        self._f = open(self._path, "w")
+        # flock blocks, so wait for other worker processes off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, fcntl.flock, self._f, fcntl.LOCK_EX)
+
+    async def __aexit__(self, *exc):
+        fcntl.flock(self._f, fcntl.LOCK_UN)
+        self._f.close()
+        self._lock.release()
+
+
+async def run_bash(model_name: str, label: str, args, station_lock: StationLock) -> dict:
+    reset_script = os.path.join(args.station_dir, "..", "reset.sh")
+    async with station_lock:
+        if os.path.exists(reset_script):
+            proc = await asyncio.create_subprocess_exec(
+                "bash", reset_script,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await proc.wait()
+        blog = Logger(args.log_dir, label, "bash", quiet=args.quiet)
+        bash_result = await run_bash_eval(model_name, args.station_dir, args.token_limit, blog,
+                                          short_prompt=args.short_prompt)
+        bash_result["label"] = label
+        blog.close()
+    return bash_result
+
+
+async def run_mcp(model_name: str, label: str, args) -> dict:
+    mlog = Logger(args.log_dir, label, "mcp", quiet=args.quiet)
+    mcp_result = await run_mcp_eval(model_name, args.token_limit, mlog)
+    mcp_result["label"] = label
+    mlog.close()
+    return mcp_result
+
+
+async def run_both(model_name: str, label: str, args, station_lock: StationLock) -> list[dict]:
+    # The two modes share no state, so run them side by side
+    bash_task = asyncio.create_task(run_bash(model_name, label, args, station_lock))
+    mcp_task = asyncio.create_task(run_mcp(model_name, label, args))
+    bash_result, mcp_result = await asyncio.gather(bash_task, mcp_task)
+    return [bash_result, mcp_result]
+
+
+async def run_labeled(model_name: str, label: str, args, station_lock: StationLock) -> list[dict]:
+    print(f"\n{'='*60}")
+    print(f"  Running: {label} ({model_name})")
+    print(f"{'='*60}\n")
+    return await run_both(model_name, label, args, station_lock)
+
+
+def run_both_worker(model_name: str, label: str, args) -> list[dict]:
+    """Process-pool entry point: one model's evals on the worker's own event loop."""
+    return asyncio.run(run_labeled(model_name, label, args, StationLock(args.station_dir)))
+
+
+async def gather_bounded(coros, concurrency: int) -> list:
+    """Await coroutines concurrently, with at most `concurrency` running at once."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bounded(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(bounded(c) for c in coros))
+
+
 def load_models(models_file: str) -> list[dict]:
     with open(models_file) as f:
         data = yaml.safe_load(f)
@@ -368,6 +657,12 @@ def main():
     parser.add_argument("--station-dir", default=None, help="Path to station/ directory")
     parser.add_argument("--token-limit", type=int, default=50000, help="Max total tokens before stopping")
     parser.add_argument("--log-dir", default=None, help="Directory for log files")
+    parser.add_argument("--short-prompt", action="store_true",
+                        help="Drop the GOOD/BAD examples from the bash system prompt")
+    parser.add_argument("--quiet", action="store_true", help="Write turn logs to files only, not stdout")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max models evaluated at once with --all")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="With --all, spread models over this many processes (0 = single process, asyncio only)")
     args = parser.parse_args()
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -387,46 +682,30 @@ def main():
         print(f"ERROR: Station directory not found: {args.station_dir}")
         sys.exit(1)
 
-    reset_script = os.path.join(args.station_dir, "..", "reset.sh")
-
-    def run_both(model_name: str, label: str) -> list[dict]:
-        # bash
-        if os.path.exists(reset_script):
-            os.system(f"bash {reset_script}")
-        blog = Logger(args.log_dir, label, "bash")
-        bash_result = run_bash_eval(model_name, args.station_dir, args.token_limit, blog)
-        bash_result["label"] = label
-        blog.close()
-
-        # mcp
-        mlog = Logger(args.log_dir, label, "mcp")
-        mcp_result = run_mcp_eval(model_name, args.token_limit, mlog)
-        mcp_result["label"] = label
-        mlog.close()
-
-        return [bash_result, mcp_result]
-
     if args.all:
         models = load_models(args.models_file)
         if not models:
             print(f"ERROR: No models found in {args.models_file}")
             sys.exit(1)
 
-        results = []
-        for entry in models:
-            model_name = entry["name"]
-            label = entry.get("label", model_name)
-            print(f"\n{'='*60}")
-            print(f"  Running: {label} ({model_name})")
-            print(f"{'='*60}\n")
-
-            for r in run_both(model_name, label):
-                r["label"] = label
-                results.append(r)
+        entries = [(e["name"], e.get("label", e["name"])) for e in models]
+        if args.workers > 0:
+            # One pool for the whole run, so worker startup is paid once
+            pool = ProcessPoolExecutor(max_workers=min(args.workers, os.cpu_count() or 1, len(entries)))
+            try:
+                futures = [pool.submit(run_both_worker, name, label, args) for name, label in entries]
+                per_model = [f.result() for f in futures]
+            finally:
+                pool.shutdown()
+        else:
+            station_lock = StationLock(args.station_dir)
+            tasks = [run_labeled(name, label, args, station_lock) for name, label in entries]
+            per_model = asyncio.run(gather_bounded(tasks, concurrency=args.concurrency))
+        results = [r for pair in per_model for r in pair]
 
         _print_comparison(results)
     else:
-        results = run_both(args.model, args.model)
+        results = asyncio.run(run_both(args.model, args.model, args, StationLock(args.station_dir)))
         _print_comparison(results)
 
 
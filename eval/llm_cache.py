@@ -0,0 +1,68 @@
+"""On-disk cache of LLM responses, keyed by the exact request.
+
+Enable with LLM_CACHE=1. Only temperature-0 requests are cached, since
+anything else isn't expected to come back the same twice.
+"""
+
+import hashlib
+import json
+import os
+
+import litellm
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".llm_cache")
+
+
+def enabled() -> bool:
+    return os.environ.get("LLM_CACHE") == "1"
+
+
+def cache_key(model: str, messages: list[dict], tools) -> str:
+    """SHA-256 over the request fields that determine the response."""
+    payload = json.dumps({"model": model, "messages": messages, "tools": tools}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LlmCache:
+    """A directory of <key>.json files, one per cached response."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> dict | None:
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, data: dict):
+        # Write to a temp file and rename, so concurrent evals never see a partial entry
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp, path)
+
+
+async def acompletion(cache: LlmCache | None, *, complete=None, **kwargs):
+    """Call `complete` (default litellm.acompletion) with a cache in front.
+
+    Returns (response, cached).
+    """
+    complete = complete or litellm.acompletion
+    if cache is None or kwargs.get("temperature") != 0:
+        return await complete(**kwargs), False
+
+    key = cache_key(kwargs["model"], kwargs["messages"], kwargs.get("tools"))
+    hit = cache.get(key)
+    if hit is not None:
+        return litellm.ModelResponse(**hit), True
+
+    response = await complete(**kwargs)
+    cache.set(key, response.model_dump())
+    return response, False
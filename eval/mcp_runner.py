@@ -94,33 +94,37 @@ TOOL_SCHEMAS = [
 
 
 class McpRunner:
+    # tool name -> (engine method, name of its string argument or None)
+    _DISPATCH = {
+        "look": (GameEngine.look, None),
+        "inventory": (GameEngine.inventory, None),
+        "go": (GameEngine.go, "direction"),
+        "take": (GameEngine.take, "item"),
+        "use": (GameEngine.use, "item"),
+        "read": (GameEngine.read, "item"),
+    }
+
     def __init__(self):
         self.engine = GameEngine()
 
     def start(self) -> str:
         """Return the starting room description."""
-        return self.engine.execute("look")
+        return self.engine.look()
 
     def execute_tool(self, tool_name: str, arguments: dict) -> str:
         """Execute a tool call against the GameEngine. Returns narrative text."""
-        if tool_name == "look":
-            return self.engine.execute("look")
-        elif tool_name == "go":
-            direction = arguments.get("direction", "")
-            return self.engine.execute(f"go {direction}")
-        elif tool_name == "take":
-            item = arguments.get("item", "")
-            return self.engine.execute(f"take {item}")
-        elif tool_name == "use":
-            item = arguments.get("item", "")
-            return self.engine.execute(f"use {item}")
-        elif tool_name == "read":
-            item = arguments.get("item", "")
-            return self.engine.execute(f"read {item}")
-        elif tool_name == "inventory":
-            return self.engine.execute("inventory")
-        else:
+        entry = self._DISPATCH.get(tool_name)
+        if entry is None:
             return f"Unknown tool: '{tool_name}'"
+        method, key = entry
+        if key is None:
+            return method(self.engine)
+        arg = arguments.get(key) if isinstance(arguments, dict) else None
+        if not isinstance(arg, str):
+            # Required argument missing (or not a string): the bare verb gets
+            # the engine's "Go where?" etc.
+            return self.engine.execute(tool_name)
+        return method(self.engine, arg)
 
     def check_win(self) -> bool:
         return self.engine.is_won()
@@ -7,23 +7,91 @@ import sys
 from collections import defaultdict
 from datetime import datetime
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-def load_runs(log_dir: str) -> list[dict]:
-    """Load all JSON run files from the log directory."""
+# Run summaries appended by the harness, one JSON object per line
+RUNS_FILE = "runs.jsonl"
+
+# Per-file parse results, keyed by filename and mtime, so re-runs skip unchanged logs
+CACHE_FILE = ".report_cache.json"
+
+
+def _load_cache(log_dir: str) -> dict:
+    try:
+        with open(os.path.join(log_dir, CACHE_FILE), "rb") as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(log_dir: str, cache: dict):
+    try:
+        with open(os.path.join(log_dir, CACHE_FILE), "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _load_runs_jsonl(log_dir: str) -> list[dict]:
     runs = []
-    for fname in os.listdir(log_dir):
-        if not fname.endswith(".json"):
-            continue
-        path = os.path.join(log_dir, fname)
-        try:
-            with open(path) as f:
-                data = json.load(f)
-            # Must have required fields
-            if "model" in data and "mode" in data and "total_tokens" in data:
-                data["_file"] = fname
+    try:
+        with open(os.path.join(log_dir, RUNS_FILE), "rb") as f:
+            for line in f:
+                try:
+                    data = _loads(line)
+                except ValueError:
+                    continue  # e.g. a line cut short by a crash
+                data["_file"] = data.pop("file", RUNS_FILE)
                 runs.append(data)
-        except (json.JSONDecodeError, KeyError):
+    except FileNotFoundError:
+        pass
+    return runs
+
+
+def load_runs(log_dir: str) -> list[dict]:
+    """Load all runs from the log directory.
+
+    Summaries in runs.jsonl are read in one pass; per-run JSON files are
+    only parsed for runs it doesn't cover (e.g. logs from older harnesses).
+    A summary whose JSON file has been deleted is dropped with it, so
+    removing a run's file still removes the run from the report.
+    """
+    with os.scandir(log_dir) as it:
+        entries = [e for e in it if e.name.endswith(".json") and e.name != CACHE_FILE]
+    present = {e.name for e in entries}
+    runs = [r for r in _load_runs_jsonl(log_dir) if r["_file"] in present or r["_file"] == RUNS_FILE]
+    covered = {r["_file"] for r in runs}
+    cache = _load_cache(log_dir)
+    fresh = {}
+    for entry in entries:
+        fname = entry.name
+        if fname in covered:
             continue
+        mtime = entry.stat().st_mtime
+        cached = cache.get(fname)
+        if cached is not None and cached["mtime"] == mtime:
+            data = cached["data"]
+        else:
+            try:
+                with open(entry.path, "rb") as f:
+                    data = _loads(f.read())
+            except (OSError, ValueError):
+                continue
+            # Must have required fields
+            if not isinstance(data, dict) or not ("model" in data and "mode" in data and "total_tokens" in data):
+                data = None
+            else:
+                # The conversation is only for replay; keep the cache small
+                data.pop("conversation", None)
+        fresh[fname] = {"mtime": mtime, "data": data}
+        if data is not None:
+            runs.append({**data, "_file": fname})
+    if fresh != cache:
+        _save_cache(log_dir, fresh)
     return runs
 
 
@@ -106,34 +174,34 @@ def generate_report(log_dir: str):
 def compute_stats(grouped, all_labels, modes):
     """Compute per-model stats and leaderboard from grouped runs."""
     rows = []
+    leaderboard = []
     for label in all_labels:
         for mode in modes:
-            key = (label, mode)
-            if key not in grouped:
+            entries = grouped.get((label, mode))
+            if not entries:
                 continue
-            entries = grouped[key]
-            n = len(entries)
-            wins = sum(1 for e in entries if e["won"])
-            win_pct = (wins / n * 100) if n else 0
-            tokens = [e["total_tokens"] for e in entries]
-            avg_tok = sum(tokens) / n
-            min_tok = min(tokens)
-            max_tok = max(tokens)
-            turns = [e["turns"] for e in entries]
-            avg_turns = sum(turns) / n
+            # One pass per group for all the stats, including the leaderboard's
+            n = wins = tok_sum = win_tok_sum = turns_sum = 0
+            min_tok = max_tok = None
+            for e in entries:
+                tok = e["total_tokens"]
+                n += 1
+                tok_sum += tok
+                turns_sum += e["turns"]
+                if min_tok is None or tok < min_tok:
+                    min_tok = tok
+                if max_tok is None or tok > max_tok:
+                    max_tok = tok
+                if e["won"]:
+                    wins += 1
+                    win_tok_sum += tok
             rows.append({
                 "label": label, "mode": mode, "n": n, "wins": wins,
-                "win_pct": win_pct, "avg_tok": avg_tok, "min_tok": min_tok,
-                "max_tok": max_tok, "avg_turns": avg_turns,
+                "win_pct": (wins / n * 100) if n else 0, "avg_tok": tok_sum / n,
+                "min_tok": min_tok, "max_tok": max_tok, "avg_turns": turns_sum / n,
             })
-
-    leaderboard = []
-    for (label, mode), entries in grouped.items():
-        winners = [e for e in entries if e["won"]]
-        if not winners:
-            continue
-        avg = sum(e["total_tokens"] for e in winners) / len(winners)
-        leaderboard.append((avg, label, mode, len(winners)))
+            if wins:
+                leaderboard.append((win_tok_sum / wins, label, mode, wins))
     leaderboard.sort()
 
     return rows, leaderboard
@@ -1,202 +1,366 @@
 """Core game engine — pure state machine, no I/O."""
 
-from game_logic.world import ROOMS, ITEMS, START_ROOM, INITIAL_FLAGS
+import functools
+import sys
+from typing import Callable, Final
+
+from game_logic.world import (
+    Room, ROOMS, DIR_IDX, ROOM_ITEMS,
+    ITEMS, ITEM_ALIASES, ITEM_BITS, ITEM_SORTED,
+    LIT_BIT, DESCRIPTIONS, START_ROOM, INITIAL_FLAGS,
+)
+
+HELP_TEXT: Final = (
+    "Commands:\n"
+    "  look          - Examine your surroundings\n"
+    "  go <direction> - Move (north, south, east, west)\n"
+    "  take <item>   - Pick up an item\n"
+    "  use <item>    - Use an item\n"
+    "  read <item>   - Read an item\n"
+    "  inventory     - Check what you're carrying\n"
+    "  help          - Show this message"
+)
+
+CREW_LOG_TEXT: Final = f"You read the crew log:\n\n{ITEMS['crew_log']['read_text']}"
+
+# Fixed responses, shared rather than rebuilt per call
+MSG_EMPTY: Final = "Say something. Type 'help' for commands."
+MSG_GO_WHERE: Final = "Go where? Specify a direction (north, south, east, west)."
+MSG_TAKE_WHAT: Final = "Take what?"
+MSG_USE_WHAT: Final = "Use what?"
+MSG_READ_WHAT: Final = "Read what?"
+MSG_ALREADY_LIT: Final = "The flashlight is already on. The room is lit."
+MSG_FLASHLIGHT_ON: Final = (
+    "You switch on the flashlight. The beam cuts through the darkness. "
+    "You can see the engine core now — and something glinting under "
+    "a pile of debris near the wall. It looks like a keycard."
+)
+MSG_FLASHLIGHT_WAVE: Final = "You wave the flashlight around. Nothing interesting here."
+MSG_KEYCARD_NOWHERE: Final = "There's nothing to use the keycard on here."
+MSG_NO_CREW_LOG: Final = "You don't have the crew log."
+MSG_EMPTY_INVENTORY: Final = "You aren't carrying anything."
+MSG_WIN: Final = (
+    "You slide the keycard into the console. Screens flicker to life. "
+    "The station's distress beacon activates — a rescue signal pulses "
+    "out into deep space.\n\n"
+    "*** YOU WIN ***\n"
+)
+
+# Inventory mask -> the sorted item ids as the status line lists them
+_STATUS_INVENTORY = {
+    mask: ", ".join(iid for iid in ITEM_SORTED if mask & ITEM_BITS[iid]) or "empty"
+    for mask in range(1 << len(ITEMS))
+}
+
+
+# Commands that need no normalizing when typed exactly like this
+_BARE_VERBS = frozenset({"look", "inventory", "help"})
+
+# (room id, inventory mask, taken mask, lit, won): everything but the move count
+State = tuple[str, int, int, bool, bool]
+
+
+# Puzzle flag name (as in INITIAL_FLAGS and take_condition) -> engine attribute
+_FLAG_ATTRS = {
+    "engine_room_lit": "flag_lit",
+    "console_activated": "flag_won",
+}
 
 
 class GameEngine:
-    def __init__(self):
+    __slots__ = (
+        "current_room", "_room", "moves", "inventory_mask", "taken_mask",
+        "flag_lit", "flag_won", "_state", "_cached_description", "_desc_dirty",
+    )
+
+    # Declared with concrete types so the module can be compiled with mypyc
+    current_room: str
+    _room: Room
+    moves: int
+    inventory_mask: int
+    taken_mask: int
+    flag_lit: bool
+    flag_won: bool
+    _state: State
+    _cached_description: str
+    _desc_dirty: bool
+
+    def __init__(self) -> None:
         self.current_room = START_ROOM
-        self.inventory: set[str] = set()
-        self.flags = dict(INITIAL_FLAGS)
-        self.taken_items: set[str] = set()
+        self._room = ROOMS[START_ROOM]
+        # Items carried / ever picked up, as bitmasks over ITEM_BITS
+        self.inventory_mask = 0
+        self.taken_mask = 0
+        # The flag set is fixed, so each flag is a plain attribute
+        self.flag_lit = INITIAL_FLAGS["engine_room_lit"]
+        self.flag_won = INITIAL_FLAGS["console_activated"]
         self.moves = 0
+        # Description of the current room; recomputed only after the room,
+        # the lit flag or the taken items change
+        self._cached_description = ""
+        self._desc_dirty = True
+        # Everything above except moves, as a key into _TRANSITIONS
+        self._state = self._state_tuple()
 
     def execute(self, command: str) -> str:
         """Parse and execute a command. Returns narrative text."""
-        command = command.strip().lower()
+        # The argument-less commands clients send most, checked before parsing
+        if command in _BARE_VERBS:
+            return self._run(command, "")
         if not command:
-            return "Say something. Type 'help' for commands."
-
-        parts = command.split(maxsplit=1)
-        verb = parts[0]
-        arg = parts[1] if len(parts) > 1 else ""
-
-        dispatch = {
-            "look": self._look,
-            "go": self._go,
-            "take": self._take,
-            "use": self._use,
-            "inventory": self._inventory,
-            "help": self._help,
-            "read": self._read,
-        }
-
-        handler = dispatch.get(verb)
-        if handler is None:
+            return MSG_EMPTY
+        verb, arg = _parse(command)
+        if not verb:
+            return MSG_EMPTY
+        if verb not in _DISPATCH:
             return f"Unknown command: '{verb}'. Type 'help' for commands."
-
-        self.moves += 1
-        return handler(arg)
+        return self._run(verb, arg)
 
     def is_won(self) -> bool:
-        return self.flags.get("console_activated", False)
+        return self.flag_won
 
-    def get_state(self) -> dict:
+    def get_state(self) -> dict[str, object]:
         return {
             "current_room": self.current_room,
-            "inventory": sorted(self.inventory),
-            "flags": dict(self.flags),
+            "inventory": self._inventory_ids(),
+            "flags": {name: getattr(self, attr) for name, attr in _FLAG_ATTRS.items()},
             "moves": self.moves,
             "won": self.is_won(),
         }
 
-    # -- command handlers --
+    def format_status(self) -> str:
+        """Room, inventory, moves and win status as four lines, for the MCP status tool."""
+        return (
+            f"Room: {self.current_room}\n"
+            f"Inventory: {_STATUS_INVENTORY[self.inventory_mask]}\n"
+            f"Moves: {self.moves}\n"
+            f"Won: {self.flag_won}"
+        )
 
-    def _look(self, _arg: str) -> str:
-        room = ROOMS[self.current_room]
+    # -- direct entry points, for callers that already know the verb (MCP
+    # tools); same result as execute("<verb> <arg>") without the parsing --
 
-        if self.current_room == "engine_room":
-            if not self.flags["engine_room_lit"]:
-                return room["description_dark"]
-            elif "keycard" not in self.taken_items:
-                return room["description_lit"]
-            else:
-                return room["description_looted"]
+    def look(self) -> str:
+        return self._run("look", "")
 
-        if self.current_room == "med_bay":
-            if "crew_log" in self.taken_items:
-                return room["description_looted"]
+    def go(self, direction: str) -> str:
+        return self._run("go", direction.strip().lower())
 
-        return room["description"]
+    def take(self, item: str) -> str:
+        return self._run("take", item.strip().lower())
 
-    def _go(self, direction: str) -> str:
-        if not direction:
-            return "Go where? Specify a direction (north, south, east, west)."
+    def use(self, item: str) -> str:
+        return self._run("use", item.strip().lower())
 
-        room = ROOMS[self.current_room]
-        exits = room["exits"]
+    def read(self, item: str) -> str:
+        return self._run("read", item.strip().lower())
 
-        if direction not in exits:
-            available = ", ".join(exits.keys())
-            return f"You can't go {direction}. Exits: {available}."
+    def inventory(self) -> str:
+        return self._run("inventory", "")
 
-        self.current_room = exits[direction]
-        return self._enter_room()
+    def help(self) -> str:
+        return self._run("help", "")
 
-    def _enter_room(self) -> str:
-        room = ROOMS[self.current_room]
-        prefix = f"You enter the {room['name']}.\n\n"
+    def _run(self, verb: str, arg: str) -> str:
+        """Run a known verb, counting the move."""
+        self.moves += 1
+        hit = _TRANSITIONS.get((self._state, verb, arg))
+        if hit is not None:
+            state, response = hit
+            if state != self._state:
+                self._load_state(state)
+            return response
+        response = _DISPATCH[verb](self, arg)
+        self._state = self._state_tuple()
+        return response
+
+    def _state_tuple(self) -> State:
+        return (self.current_room, self.inventory_mask, self.taken_mask, self.flag_lit, self.flag_won)
+
+    def _load_state(self, state: State) -> None:
+        self.current_room, self.inventory_mask, self.taken_mask, self.flag_lit, self.flag_won = state
+        self._room = ROOMS[self.current_room]
+        self._state = state
+        self._desc_dirty = True
+
+    def _inventory_ids(self) -> list[str]:
+        return [iid for iid in ITEM_SORTED if self.inventory_mask & ITEM_BITS[iid]]
+
+    # -- command handlers --
+
+    def _description(self) -> str:
+        if self._desc_dirty:
+            bits = self.taken_mask | (LIT_BIT if self.flag_lit else 0)
+            self._cached_description = DESCRIPTIONS[self.current_room, bits]
+            self._desc_dirty = False
+        return self._cached_description
 
-        if self.current_room == "engine_room" and not self.flags["engine_room_lit"]:
-            return prefix + room["description_dark"]
+    def _look(self, _arg: str) -> str:
+        return self._description()
+
+    def _go(self, direction: str) -> str:
+        if not direction:
+            return MSG_GO_WHERE
 
-        if self.current_room == "engine_room":
-            if "keycard" not in self.taken_items:
-                return prefix + room["description_lit"]
-            return prefix + room["description_looted"]
+        idx = DIR_IDX.get(direction)
+        destination = None if idx is None else self._room.exits_arr[idx]
+        if destination is None:
+            return f"You can't go {direction}. Exits: {self._room.exits_str}."
 
-        if self.current_room == "med_bay" and "crew_log" in self.taken_items:
-            return prefix + room["description_looted"]
+        self.current_room = destination
+        self._room = ROOMS[self.current_room]
+        self._desc_dirty = True
+        return self._enter_room()
 
-        return prefix + room["description"]
+    def _enter_room(self) -> str:
+        return self._room.enter_prefix + self._description()
 
     def _take(self, item_name: str) -> str:
         if not item_name:
-            return "Take what?"
+            return MSG_TAKE_WHAT
 
-        item_name = item_name.replace("_", " ")
+        item_id = ROOM_ITEMS[self.current_room].get(item_name)
+        if item_id is not None:
+            item = ITEMS[item_id]
+            bit = ITEM_BITS[item_id]
+            if self.taken_mask & bit:
+                return f"You already took the {item['name']}."
 
-        for item_id, item in ITEMS.items():
-            if item["name"] == item_name and item["location"] == self.current_room:
-                if item_id in self.taken_items:
-                    return f"You already took the {item_name}."
+            condition = item.get("take_condition")
+            if condition and not getattr(self, _FLAG_ATTRS[condition]):
+                return item.get("take_fail", "You can't take that right now.")
 
-                condition = item.get("take_condition")
-                if condition and not self.flags.get(condition, False):
-                    return item.get("take_fail", "You can't take that right now.")
+            self.inventory_mask |= bit
+            self.taken_mask |= bit
+            self._desc_dirty = True
+            return f"You pick up the {item['name']}."
 
-                self.inventory.add(item_id)
-                self.taken_items.add(item_id)
-                return f"You pick up the {item['name']}."
-
-        return f"There's no '{item_name}' here to take."
+        # Echo what was typed the way a display name would read
+        return f"There's no '{item_name.replace('_', ' ')}' here to take."
 
     def _use(self, item_name: str) -> str:
         if not item_name:
-            return "Use what?"
-
-        item_name = item_name.replace("_", " ")
+            return MSG_USE_WHAT
 
-        # Map item names to item IDs for lookup
-        item_id = None
-        for iid, item in ITEMS.items():
-            if item["name"] == item_name:
-                item_id = iid
-                break
+        item_id = ITEM_ALIASES.get(item_name)
 
-        if item_id is None or item_id not in self.inventory:
-            return f"You don't have a '{item_name}'."
+        if item_id is None:
+            return f"You don't have a '{item_name.replace('_', ' ')}'."
+        if not self.inventory_mask & ITEM_BITS[item_id]:
+            return f"You don't have a '{ITEMS[item_id]['name']}'."
 
         # Flashlight in engine room
         if item_id == "flashlight" and self.current_room == "engine_room":
-            if self.flags["engine_room_lit"]:
-                return "The flashlight is already on. The room is lit."
-            self.flags["engine_room_lit"] = True
-            return (
-                "You switch on the flashlight. The beam cuts through the darkness. "
-                "You can see the engine core now — and something glinting under "
-                "a pile of debris near the wall. It looks like a keycard."
-            )
+            if self.flag_lit:
+                return MSG_ALREADY_LIT
+            self.flag_lit = True
+            self._desc_dirty = True
+            return MSG_FLASHLIGHT_ON
 
         # Flashlight elsewhere
         if item_id == "flashlight":
-            return "You wave the flashlight around. Nothing interesting here."
+            return MSG_FLASHLIGHT_WAVE
 
         # Keycard on bridge
         if item_id == "keycard" and self.current_room == "bridge":
-            self.flags["console_activated"] = True
-            return (
-                "You slide the keycard into the console. Screens flicker to life. "
-                "The station's distress beacon activates — a rescue signal pulses "
-                "out into deep space.\n\n"
-                "*** YOU WIN ***\n"
-                f"Completed in {self.moves} moves."
-            )
+            self.flag_won = True
+            return f"{MSG_WIN}Completed in {self.moves} moves."
 
         # Keycard elsewhere
         if item_id == "keycard":
-            return "There's nothing to use the keycard on here."
+            return MSG_KEYCARD_NOWHERE
 
         # Crew log
         if item_id == "crew_log":
-            return f"You read the crew log:\n\n{ITEMS['crew_log']['read_text']}"
+            return CREW_LOG_TEXT
 
-        return f"You can't figure out how to use the {item_name} here."
+        return f"You can't figure out how to use the {ITEMS[item_id]['name']} here."
 
     def _read(self, item_name: str) -> str:
         if not item_name:
-            return "Read what?"
-        item_name = item_name.replace("_", " ")
-        if item_name == "crew log" and "crew_log" in self.inventory:
-            return f"You read the crew log:\n\n{ITEMS['crew_log']['read_text']}"
-        if item_name == "crew log":
-            return "You don't have the crew log."
-        return f"You can't read '{item_name}'."
+            return MSG_READ_WHAT
+        if ITEM_ALIASES.get(item_name) == "crew_log":
+            if self.inventory_mask & ITEM_BITS["crew_log"]:
+                return CREW_LOG_TEXT
+            return MSG_NO_CREW_LOG
+        return f"You can't read '{item_name.replace('_', ' ')}'."
 
     def _inventory(self, _arg: str) -> str:
-        if not self.inventory:
-            return "You aren't carrying anything."
-        names = [ITEMS[i]["name"] for i in sorted(self.inventory)]
+        if not self.inventory_mask:
+            return MSG_EMPTY_INVENTORY
+        names = [ITEMS[i]["name"] for i in self._inventory_ids()]
         return "You are carrying: " + ", ".join(names) + "."
 
     def _help(self, _arg: str) -> str:
-        return (
-            "Commands:\n"
-            "  look          - Examine your surroundings\n"
-            "  go <direction> - Move (north, south, east, west)\n"
-            "  take <item>   - Pick up an item\n"
-            "  use <item>    - Use an item\n"
-            "  read <item>   - Read an item\n"
-            "  inventory     - Check what you're carrying\n"
-            "  help          - Show this message"
-        )
+        return HELP_TEXT
+
+
+# verb -> handler, built once rather than on every execute(). Kept outside the
+# class body so it also works when the class is compiled by mypyc.
+_DISPATCH: dict[str, Callable[[GameEngine, str], str]] = {
+    "look": GameEngine._look,
+    "go": GameEngine._go,
+    "take": GameEngine._take,
+    "use": GameEngine._use,
+    "inventory": GameEngine._inventory,
+    "help": GameEngine._help,
+    "read": GameEngine._read,
+}
+
+
+# Clients repeat a handful of exact strings ("look", "go north"), so most
+# commands skip the normalizing below entirely
+@functools.lru_cache(maxsize=64)
+def _parse(command: str) -> tuple[str, str]:
+    """Normalize a command into (verb, arg); verb is "" for a blank command."""
+    command = command.strip().lower()
+    verb, _, arg = command.partition(" ")
+    # Verb literals in _DISPATCH are interned, so interning the input lets
+    # the dict lookup match on identity instead of comparing characters
+    verb = sys.intern(verb)
+    if verb and verb not in _DISPATCH:
+        # Maybe the verb ends in some other whitespace ("go\tnorth");
+        # split on any whitespace as well before giving up
+        parts = command.split(maxsplit=1)
+        verb = sys.intern(parts[0])
+        arg = parts[1] if len(parts) > 1 else ""
+    # Like split(), drop any extra whitespace between verb and argument
+    return verb, arg.lstrip()
+
+
+def _build_transitions() -> dict[tuple[State, str, str], tuple[State, str]]:
+    """Precompute (state, verb, arg) -> (next state, response) for every state
+    reachable with the commands a player needs to win.
+
+    The world is fixed, so this is a few hundred entries. Responses that
+    depend on the move count (the win message) are left to the handler, as
+    is anything typed that isn't in the list below.
+    """
+    directions = {d for room in ROOMS.values() for d in room.exits}
+    commands = [("look", ""), ("inventory", ""), ("help", "")]
+    commands += [("go", d) for d in sorted(directions)]
+    commands += [(verb, alias) for verb in ("take", "use", "read") for alias in ITEM_ALIASES]
+
+    engine = GameEngine()
+    start = engine._state_tuple()
+    table: dict[tuple[State, str, str], tuple[State, str]] = {}
+    seen = {start}
+    pending = [start]
+    while pending:
+        state = pending.pop()
+        for verb, arg in commands:
+            responses = []
+            for moves in (0, 1):
+                engine._load_state(state)
+                engine.moves = moves
+                responses.append(_DISPATCH[verb](engine, arg))
+            next_state = engine._state_tuple()
+            if responses[0] == responses[1]:
+                table[state, verb, arg] = (next_state, responses[0])
+            if next_state not in seen:
+                seen.add(next_state)
+                pending.append(next_state)
+    return table
+
+
+_TRANSITIONS = _build_transitions()
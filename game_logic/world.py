@@ -1,6 +1,25 @@
 """Space station world definition: rooms, items, connections, and puzzle logic."""
 
-ROOMS = {
+import sys
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, frozen=True)
+class Room:
+    name: str
+    description: str = ""
+    # Variants for rooms whose description depends on puzzle state
+    description_dark: str = ""
+    description_lit: str = ""
+    description_looted: str = ""
+    exits: dict[str, str] = field(default_factory=dict)
+    # Derived once from the fields above
+    exits_str: str = ""  # "north, south", for the can't-go message
+    exits_arr: tuple[str | None, ...] = ()  # destination per DIR_IDX slot, None if no exit
+    enter_prefix: str = ""  # "You enter the <name>.\n\n"
+
+
+_RAW_ROOMS = {
     "airlock": {
         "name": "Airlock",
         "description": (
@@ -69,6 +88,23 @@ ROOMS = {
     },
 }
 
+# Direction -> slot in Room.exits_arr
+DIR_IDX = {"north": 0, "south": 1, "east": 2, "west": 3}
+
+
+def _build_room(d: dict) -> Room:
+    # Interned exit keys let lookups of interned input short-circuit on identity
+    exits = {sys.intern(k): sys.intern(v) for k, v in d["exits"].items()}
+    return Room(
+        **{**d, "exits": exits},
+        exits_str=", ".join(exits),
+        exits_arr=tuple(exits.get(direction) for direction in DIR_IDX),
+        enter_prefix=f"You enter the {d['name']}.\n\n",
+    )
+
+
+ROOMS = {room_id: _build_room(d) for room_id, d in _RAW_ROOMS.items()}
+
 ITEMS = {
     "flashlight": {
         "name": "flashlight",
@@ -94,6 +130,47 @@ ITEMS = {
     },
 }
 
+# Item display name -> item id, for resolving what the player typed
+ITEM_NAME_TO_ID = {item["name"]: iid for iid, item in ITEMS.items()}
+
+# Everything a player may type for an item -> item id: the display name, plus
+# the same with underscores for spaces ("crew_log")
+ITEM_ALIASES = {
+    alias: iid
+    for name, iid in ITEM_NAME_TO_ID.items()
+    for alias in (name, name.replace(" ", "_"))
+}
+
+# Room id -> {alias: item id} for the items that start out in that room
+ROOM_ITEMS: dict[str, dict[str, str]] = {
+    room_id: {alias: iid for alias, iid in ITEM_ALIASES.items() if ITEMS[iid]["location"] == room_id}
+    for room_id in ROOMS
+}
+
+# Puzzle state that picks a room's description, packed into an int: one bit
+# per taken item (in ITEMS order) plus one for the engine room being lit.
+ITEM_BITS = {iid: 1 << i for i, iid in enumerate(ITEMS)}
+LIT_BIT = 1 << len(ITEMS)
+# Item ids in sorted order, for listing a mask's items the way sorted() would
+ITEM_SORTED = sorted(ITEMS)
+
+
+def _describe(room_id: str, bits: int) -> str:
+    room = ROOMS[room_id]
+    if room_id == "engine_room":
+        if not bits & LIT_BIT:
+            return room.description_dark
+        if not bits & ITEM_BITS["keycard"]:
+            return room.description_lit
+        return room.description_looted
+    if room_id == "med_bay" and bits & ITEM_BITS["crew_log"]:
+        return room.description_looted
+    return room.description
+
+
+# (room id, state bits) -> description, for every reachable combination
+DESCRIPTIONS = {(rid, bits): _describe(rid, bits) for rid in ROOMS for bits in range(LIT_BIT << 1)}
+
 START_ROOM = "airlock"
 
 # Flags that track puzzle state (all start False)